@@ -12,5 +12,11 @@ if __name__ == "__main__":
     endpoint_response = endpoint.retrieve_data("20231201")
 
     # Parse the JSON to a DataFrame
-    # In our current implementation, the record_path is a property of the specific DataRetriever
-    response_df = parse_json_response(endpoint_response, endpoint.record_path)
+    # In our current implementation, the record_path, its precompiled record_accessor and
+    # the dtype_schema are properties of the specific DataRetriever
+    response_df = parse_json_response(
+        endpoint_response,
+        endpoint.record_path,
+        dtype=endpoint.dtype_schema,
+        record_accessor=endpoint.record_accessor,
+    )
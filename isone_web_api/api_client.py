@@ -1,16 +1,49 @@
 """Module for functions to access ISO-NE API endpoints"""
+import asyncio
+import hashlib
+import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+from urllib.parse import urlencode
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster JSON parser
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # httpx is an optional dependency for asynchronous HTTP/2 requests
+    httpx = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is an optional dependency for the on-disk response cache
+    zstandard = None
+
+# Loaded credentials keyed by the dotenv path and the credential environment variables
+_SECRETS_CACHE: dict = {}
 
 
 def load_environment_secrets(dotenv_path=None):
     """
     Loads API credentials from environment variables.
 
+    Results are memoized per dotenv path and current credential environment variables,
+    so repeated calls skip re-reading the dotenv file. Call
+    `load_environment_secrets.cache_clear()` to reset the memo.
+
     Args:
     dotenv_path (str): Optional path to a dotenv file to load. If not provided, defaults to '.env'.
 
@@ -20,6 +53,13 @@ def load_environment_secrets(dotenv_path=None):
     Raises:
     RuntimeError: If the required environment variables are not set.
     """
+    cache_key = (
+        dotenv_path,
+        os.environ.get("API_USERNAME"),
+        os.environ.get("API_PASSWORD"),
+    )
+    if cache_key in _SECRETS_CACHE:
+        return _SECRETS_CACHE[cache_key]
 
     # Loading through dotenv is required to use the getenv method
     if dotenv_path:
@@ -34,9 +74,17 @@ def load_environment_secrets(dotenv_path=None):
         logging.error("API credentials not found in environment variables.")
         raise RuntimeError("API credentials are required but not set.")
 
+    # load_dotenv populates the environment, so also memoize under the post-load key
+    _SECRETS_CACHE[cache_key] = api_username, api_password
+    _SECRETS_CACHE[
+        (dotenv_path, os.environ.get("API_USERNAME"), os.environ.get("API_PASSWORD"))
+    ] = (api_username, api_password)
     return api_username, api_password
 
 
+load_environment_secrets.cache_clear = _SECRETS_CACHE.clear
+
+
 class ISONEClient:
     """
     A client for interacting with the ISO New England API.
@@ -46,48 +94,359 @@ class ISONEClient:
 
     Attributes:
         BASE_URL (str): Base URL for the ISO New England API.
+        POOL_MAXSIZE (int): Maximum number of connections kept alive per host.
+        ETAG_CACHE_SIZE (int): Default maximum number of responses kept for conditional requests.
+        RETRY_TOTAL (int): Number of times a failed request is retried.
+        RETRY_BACKOFF_FACTOR (float): Base of the exponential backoff between retries, in seconds.
+        RETRY_STATUS_FORCELIST (tuple): Response status codes that are retried.
         auth (HTTPBasicAuth): Authentication credentials for the API.
+        session (requests.Session): Persistent session reusing connections across requests.
+        cache_dir (Path or None): Directory of zstd-compressed response bodies, if caching to disk.
+        cache_ttl (float or None): Seconds a cached response body stays valid, if it expires.
 
     Methods:
-        get_data(endpoint, params=None, format="json"): Retrieve data from a specific endpoint.
+        get_data(endpoint, params=None, format="json", stream=False): Retrieve data from a
+            specific endpoint.
+        close(): Close the underlying session and release its connections.
+        async_session(max_connections=1): Create an HTTP/2 client for asynchronous requests.
+        async_get_data(async_session, endpoint, params=None, format="json"): Asynchronously
+            retrieve data from a specific endpoint.
+
+    The client can be used as a context manager to close the session on exit:
+
+        with ISONEClient() as client:
+            client.get_data("genfuelmix/day/20231201")
     """
 
+    __slots__ = (
+        "auth",
+        "session",
+        "cache_dir",
+        "cache_ttl",
+        "_base_prefix",
+        "_ext_json",
+        "_etag_cache",
+        "_etag_cache_size",
+        "_etag_lock",
+    )
+
     BASE_URL = "https://webservices.iso-ne.com/api/v1.1"
+    POOL_MAXSIZE = 32
+    ETAG_CACHE_SIZE = 128
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_ttl: Optional[float] = None,
+        etag_cache_size: Optional[int] = None,
+    ):
         """
         Initialize the API client with the necessary authentication credentials.
+
+        Args:
+            cache_dir (str or Path, optional): Directory in which to keep zstd-compressed
+                response bodies, so repeated requests are served from disk, including
+                across processes. Requires the optional `zstandard` package.
+                Defaults to no on-disk cache.
+            cache_ttl (float, optional): Seconds after which a cached response body is
+                fetched again. Defaults to cached bodies never expiring.
+            etag_cache_size (int, optional): Maximum number of parsed responses kept in
+                memory for conditional requests, or 0 to disable them. Defaults to
+                `ETAG_CACHE_SIZE`.
         """
         # Setup the HTTP Basic Authentication with the provided username and password
         username, password = load_environment_secrets()
         self.auth = HTTPBasicAuth(username, password)
 
-    def get_data(self, endpoint, params=None, file_format="json"):
+        # A persistent session keeps connections alive between calls, so only the
+        # first request pays for the TCP and TLS handshakes
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update(
+            {"Accept": "application/json", "Accept-Encoding": "gzip, deflate"}
+        )
+
+        # Size the pool for concurrent use and retry transient server errors with backoff
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=self.RETRY_TOTAL,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                status_forcelist=self.RETRY_STATUS_FORCELIST,
+                allowed_methods=frozenset(["GET"]),
+                # Hand the last response back so raise_for_status raises HTTPError
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+
+        # URL pieces shared by every request, built once
+        self._base_prefix = f"{self.BASE_URL}/"
+        self._ext_json = ".json"
+
+        # Parsed responses with their validators (ETag, Last-Modified), keyed by request URL
+        # and kept in least recently used order
+        self._etag_cache = OrderedDict()
+        self._etag_cache_size = (
+            self.ETAG_CACHE_SIZE if etag_cache_size is None else etag_cache_size
+        )
+        self._etag_lock = threading.Lock()
+
+        if cache_dir is not None and zstandard is None:
+            raise ImportError("The zstandard package is required to cache responses to disk.")
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl = cache_ttl
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying session and release its pooled connections.
+        """
+        self.session.close()
+
+    def async_session(self, max_connections=1):
+        """
+        Create an HTTP/2 client carrying this client's credentials, for `async_get_data`.
+
+        HTTP/2 multiplexes concurrent requests as streams over a single connection, so
+        by default all requests share one TLS handshake. If the server only speaks
+        HTTP/1.1, raise `max_connections` to keep requests from being serialized.
+        Requires the optional `httpx` package with its `http2` extra.
+
+        Args:
+            max_connections (int, optional): Maximum number of connections to open.
+                                             Defaults to 1.
+
+        Returns:
+            httpx.AsyncClient: A client to be used as an async context manager.
+        """
+        if httpx is None:
+            raise ImportError("The httpx package is required for asynchronous requests.")
+
+        return httpx.AsyncClient(
+            http2=True,
+            auth=(self.auth.username, self.auth.password),
+            base_url=self._base_prefix,
+            headers={"Accept": "application/json"},
+            limits=httpx.Limits(
+                max_connections=max_connections, max_keepalive_connections=max_connections
+            ),
+        )
+
+    async def async_get_data(self, async_session, endpoint, params=None, file_format="json"):
+        """
+        Asynchronously send a GET request to a specific API endpoint and return the data.
+
+        Transport errors and responses with a status in `RETRY_STATUS_FORCELIST` are
+        retried with exponential backoff, honouring a Retry-After header, as the
+        synchronous session does.
+
+        Args:
+            async_session (httpx.AsyncClient): A client created by `async_session`.
+            endpoint (str): The specific API endpoint to target.
+            params (dict, optional): The query parameters to include in the request.
+            file_format (str, optional): The desired response format ('json' or 'xml').
+                                         Defaults to 'json'.
+
+        Returns:
+            dict or str: Parsed JSON response if format is 'json', raw text if format is 'xml'.
+
+        Raises:
+            HTTPStatusError: An error occurs from the HTTP request.
+            TransportError: The request could not be sent after retrying.
+        """
+        # JSON is the client default; other formats override the Accept header
+        headers = {"Accept": f"application/{file_format}"} if file_format != "json" else None
+        # The endpoint is relative to the client's base URL
+        if file_format == "json":
+            url = "".join((endpoint, self._ext_json))
+        else:
+            url = "".join((endpoint, ".", file_format))
+
+        for attempt in range(self.RETRY_TOTAL + 1):
+            final_attempt = attempt == self.RETRY_TOTAL
+            try:
+                response = await async_session.get(url, headers=headers, params=params)
+            except httpx.TransportError:
+                if final_attempt:
+                    raise
+                response = None
+            if final_attempt or (
+                response is not None
+                and response.status_code not in self.RETRY_STATUS_FORCELIST
+            ):
+                break
+            await asyncio.sleep(self._retry_delay(attempt, response))
+
+        # Raise an exception if the request was not successful
+        response.raise_for_status()
+
+        return self._parse_content(response.content, file_format)
+
+    def _retry_delay(self, attempt, response=None):
+        """
+        Seconds to wait before retrying a request, preferring the server's Retry-After.
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return self.RETRY_BACKOFF_FACTOR * (2**attempt)
+
+    def get_data(self, endpoint, params=None, file_format="json", stream=False):
         """
         Send a GET request to a specific API endpoint and return the data.
 
+        Responses carrying an ETag or Last-Modified header are cached, and repeated
+        requests for them are made conditional; a 304 Not Modified reply returns the
+        cached data without downloading or parsing the payload again. That cached data is
+        the same object every such call returns, so callers must not mutate it; copy it
+        first, or create the client with `etag_cache_size=0`. When the client has a
+        `cache_dir`, response bodies found there are parsed without any request.
+
         Args:
             endpoint (str): The specific API endpoint to target.
             params (dict, optional): The query parameters to include in the request.
             file_format (str, optional): The desired response format ('json' or 'xml').
                                          Defaults to 'json'.
+            stream (bool, optional): Return the undecoded body stream instead of parsed data,
+                                     for incremental parsing of large responses. Streamed
+                                     responses bypass the conditional request and on-disk
+                                     caches.
+                                     Defaults to False.
 
         Returns:
             dict or str: Parsed JSON response if format is 'json', raw text if format is 'xml'.
+                         A file-like stream of the body if `stream` is True.
 
         Raises:
             HTTPError: An error occurs from the HTTP request.
         """
-        # Set the headers to request the specific data format
-        headers = {"Accept": f"application/{file_format}"}
+        # JSON is the session default; other formats override the Accept header
+        headers = {"Accept": f"application/{file_format}"} if file_format != "json" else None
         # Construct the full URL including the endpoint and format extension
-        url = f"{self.BASE_URL}/{endpoint}.{file_format}"
+        if file_format == "json":
+            url = "".join((self._base_prefix, endpoint, self._ext_json))
+        else:
+            url = "".join((self._base_prefix, endpoint, ".", file_format))
+
+        if stream:
+            response = self.session.get(url, headers=headers, params=params, stream=True)
+            response.raise_for_status()
+            # Let the stream transparently undo any gzip/deflate transfer encoding
+            response.raw.decode_content = True
+            return response.raw
+
+        cache_key = f"{url}?{urlencode(params, doseq=True)}" if params else url
 
-        # Perform the GET request with authentication and headers
-        response = requests.get(url, auth=self.auth, headers=headers, params=params)
+        # A body cached on disk needs no request at all
+        cache_path = self._cache_path(cache_key) if self.cache_dir is not None else None
+        if cache_path is not None:
+            content = self._read_cache(cache_path)
+            if content is not None:
+                return self._parse_content(content, file_format)
+
+        cached = None
+        if self._etag_cache_size:
+            with self._etag_lock:
+                cached = self._etag_cache.get(cache_key)
+
+        # Ask the server to only send the payload if it changed since it was cached
+        if cached is not None:
+            etag, last_modified, _ = cached
+            headers = dict(headers or {})
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        # Perform the GET request over the session, which carries the authentication
+        response = self.session.get(url, headers=headers, params=params)
+
+        if response.status_code == 304 and cached is not None:
+            with self._etag_lock:
+                if cache_key in self._etag_cache:
+                    self._etag_cache.move_to_end(cache_key)
+            return cached[2]
 
         # Raise an exception if the request was not successful
         response.raise_for_status()
 
-        # Return the parsed JSON data or raw text, based on the requested format
-        return response.json() if file_format == "json" else response.text
+        data = self._parse_content(response.content, file_format)
+        if cache_path is not None:
+            self._write_cache(cache_path, response.content)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self._etag_cache_size and (etag or last_modified):
+            with self._etag_lock:
+                self._etag_cache[cache_key] = (etag, last_modified, data)
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > self._etag_cache_size:
+                    self._etag_cache.popitem(last=False)
+
+        return data
+
+    @staticmethod
+    def _parse_content(content, file_format):
+        """
+        Parse a response body based on the requested format.
+        """
+        # ISO-NE always responds in UTF-8, so the body is decoded without charset detection
+        if file_format != "json":
+            return content.decode("utf-8", errors="replace")
+        # Both parsers read the raw response bytes directly, skipping the text decode
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+
+    def _cache_path(self, cache_key):
+        """
+        Locate the on-disk cache file of a request.
+        """
+        digest = hashlib.blake2b(cache_key.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.zst"
+
+    def _read_cache(self, cache_path):
+        """
+        Read a cached response body, or None if it is missing, expired or unreadable.
+        """
+        try:
+            if (
+                self.cache_ttl is not None
+                and time.time() - cache_path.stat().st_mtime > self.cache_ttl
+            ):
+                return None
+            return zstandard.ZstdDecompressor().decompress(cache_path.read_bytes())
+        except (OSError, zstandard.ZstdError):
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path, content):
+        """
+        Compress a response body to the on-disk cache, skipping it if the write fails.
+        """
+        # Write to a temporary file first so concurrent readers never see a partial body
+        temporary_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            temporary_path.write_bytes(zstandard.ZstdCompressor(level=3).compress(content))
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            # A full or read-only cache directory must not fail a successful request
+            logging.warning("Could not write the response to the cache at %s.", cache_path)
+            try:
+                temporary_path.unlink()
+            except OSError:
+                pass
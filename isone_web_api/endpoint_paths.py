@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class APIEndpoint:
     """Container for ISO-NE endpoints and JSON path"""
 
@@ -11,8 +11,9 @@ class APIEndpoint:
     json_payload_record_path: List[str]  # List of string to locate JSON data
 
 
-def create_endpoint_url(endpoint: APIEndpoint, parameters=dict):
-    return endpoint.endpoint_url.format(parameters)
+def create_endpoint_url(endpoint: APIEndpoint, parameters: dict) -> str:
+    """Substitute the named parameters into an endpoint's URL template"""
+    return endpoint.endpoint_url.format_map(parameters)
 
 
 DailyFuelMix = APIEndpoint(
@@ -1,10 +1,15 @@
 """Module of classes that use the ISONE client to reach endpoints"""
+import asyncio
+import operator
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, List
+from functools import partial, reduce
+from typing import Any, Dict, List, Optional
 
 
 from isone_web_api.api_client import ISONEClient
+from isone_web_api.endpoint_paths import DailyFuelMix
 
 
 def validate_date_format(date_text):
@@ -21,20 +26,24 @@ def validate_date_format(date_text):
     Raises:
         ValueError: If the date string is not in the correct 'YYYYMMDD' format.
     """
-    # Attempt to parse the date string into a datetime object with the expected format
+    # A cheap lexical check rules out anything that is not exactly eight ASCII digits,
+    # or whose year is below 1000 and so would not format back to four digits
+    if (
+        len(date_text) != 8
+        or not (date_text.isascii() and date_text.isdigit())
+        or date_text[0] == "0"
+    ):
+        raise ValueError(f"The date {date_text} is not in the strict format YYYYMMDD.")
+
+    # Constructing the datetime directly range-checks the calendar date (e.g. Feb 30)
+    # without going through the format-string machinery of strptime
     try:
-        parsed_date = datetime.strptime(date_text, "%Y%m%d")
+        datetime(int(date_text[:4]), int(date_text[4:6]), int(date_text[6:8]))
     except ValueError as wrong_format_error:
-        # If parsing fails, the format is incorrect, and we raise a ValueError
         raise ValueError(
             f"The date {date_text} is not in the correct format YYYYMMDD."
         ) from wrong_format_error
 
-    # If the parsing succeeds but the formatted string doesn't match the input,
-    # it means the input was in a correct but not the expected format.
-    if parsed_date.strftime("%Y%m%d") != date_text:
-        raise ValueError(f"The date {date_text} is not in the strict format YYYYMMDD.")
-
     # If the input passes both checks, the function completes successfully,
     # indicating the date_text is in the correct format.
 
@@ -50,9 +59,19 @@ class DataRetriever(ABC):
         api_client (ISONEClient): A client instance to communicate with the API.
         record_path (list): A list that defines the path to the relevant section in the JSON data
                             structure returned from the API.
+        dtype_schema (dict or None): Column dtypes of the parsed records, when the schema is known.
+        record_accessor (callable): Precompiled lookup of the records along `record_path`,
+                                    for `parse_json_response`.
     """
 
-    def __init__(self, api_client: ISONEClient, record_path: List[str]):
+    __slots__ = ("api_client", "record_path", "dtype_schema", "_record_accessor")
+
+    def __init__(
+        self,
+        api_client: ISONEClient,
+        record_path: List[str],
+        dtype_schema: Optional[Dict[str, str]] = None,
+    ):
         """
         Initialize the data retriever with an API client and a record path.
 
@@ -60,11 +79,26 @@ class DataRetriever(ABC):
             api_client (ISONEClient): The API client to be used for making requests.
             record_path (List[str]): The path to navigate through the JSON data structure
                                      to find the relevant data.
+            dtype_schema (Dict[str, str], optional): Mapping of column names to dtypes, used
+                                     to skip type inference when parsing the records.
         """
         self.api_client = api_client  # Stores the API client for HTTP communication
         self.record_path = (
             record_path  # Defines the path to data in the API's JSON response
         )
+        self.dtype_schema = dtype_schema  # Declared dtypes of the records, if known
+        # Compiles the walk down the record path once, for `parse_json_response`
+        self._record_accessor = partial(reduce, operator.getitem, tuple(record_path))
+
+    @property
+    def record_accessor(self):
+        """
+        Precompiled lookup of the records along the record path in a JSON response.
+
+        Pass it to `parse_json_response` as `record_accessor` to skip walking
+        `record_path` key by key.
+        """
+        return self._record_accessor
 
     @abstractmethod
     def retrieve_data(self, *args, **kwargs) -> Any:
@@ -95,8 +129,11 @@ class DailyFuelMixDataRetriever(DataRetriever):
         api_client (ISONEClient): A client instance to communicate with the API.
         record_path (list): A list defining the path to the daily fuel mix section in
                             the API's JSON response structure.
+        dtype_schema (dict): Declared dtypes of the daily fuel mix records.
     """
 
+    __slots__ = ("_url_template",)
+
     def __init__(self, api_client: ISONEClient):
         """
         Initialize the daily fuel mix data retriever with the API client.
@@ -108,18 +145,33 @@ class DailyFuelMixDataRetriever(DataRetriever):
         daily fuel mix data.
         """
         # Record path points to the specific data in the API response for daily fuel mixes.
-        super().__init__(api_client, record_path=["GenFuelMixes", "GenFuelMix"])
+        # Repeating labels are stored as categories and megawatts as compact floats.
+        super().__init__(
+            api_client,
+            record_path=["GenFuelMixes", "GenFuelMix"],
+            dtype_schema={
+                "GenMw": "float32",
+                "FuelCategory": "category",
+                "FuelCategoryRollup": "category",
+                "MarginalFlag": "category",
+            },
+        )
+        # Bind the endpoint template's formatter once rather than rebuilding the path per call
+        self._url_template = DailyFuelMix.endpoint_url.format
 
-    def retrieve_data(self, day: str):
+    def retrieve_data(self, day: str, stream: bool = False):
         """
         Retrieve the daily fuel mix data for a given day.
 
         Args:
             day (str): A string representing the day in the format 'YYYYMMDD' for which
                        the data is to be retrieved.
+            stream (bool, optional): Return the response body as a stream, to be parsed
+                       with `parse_json_response_stream`. Defaults to False.
 
         Returns:
-            A dictionary or a string formatted JSON response containing the daily fuel mix data.
+            A dictionary or a string formatted JSON response containing the daily fuel mix data,
+            or a stream of the response body if `stream` is True.
 
         Raises:
             ValueError: If the 'day' is not in the correct format.
@@ -127,6 +179,84 @@ class DailyFuelMixDataRetriever(DataRetriever):
         # Validates the date format before making the API call
         validate_date_format(day)
         # Constructs the endpoint using the provided day
-        endpoint = f"genfuelmix/day/{day}"
+        endpoint = self._url_template(day=day)
         # Uses the API client to get the data from the constructed endpoint
-        return self.api_client.get_data(endpoint=endpoint)
+        return self.api_client.get_data(endpoint=endpoint, stream=stream)
+
+    def retrieve_many(self, days: List[str], max_workers: int = 8) -> List[Any]:
+        """
+        Retrieve the daily fuel mix data for several days concurrently.
+
+        Requests share the client's session, so parallel calls reuse its pooled
+        keep-alive connections. The number of workers is capped at the session's
+        pool size to avoid opening connections that cannot be kept alive.
+
+        Args:
+            days (List[str]): Days in the format 'YYYYMMDD' for which data is to be retrieved.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            A list of the responses for each day, in the same order as `days`.
+
+        Raises:
+            ValueError: If any of the days is not in the correct format.
+        """
+        # Validate every date before making any API call
+        for day in days:
+            validate_date_format(day)
+        max_workers = min(max_workers, self.api_client.POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.retrieve_data, days))
+
+    async def async_retrieve_data(self, day: str, async_session):
+        """
+        Asynchronously retrieve the daily fuel mix data for a given day.
+
+        Args:
+            day (str): A string representing the day in the format 'YYYYMMDD' for which
+                       the data is to be retrieved.
+            async_session (httpx.AsyncClient): A client created by the API client's
+                       `async_session`.
+
+        Returns:
+            A dictionary containing the daily fuel mix data.
+
+        Raises:
+            ValueError: If the 'day' is not in the correct format.
+        """
+        validate_date_format(day)
+        endpoint = self._url_template(day=day)
+        return await self.api_client.async_get_data(async_session, endpoint=endpoint)
+
+    async def async_retrieve_many(
+        self, days: List[str], max_concurrency: int = 8
+    ) -> List[Any]:
+        """
+        Asynchronously retrieve the daily fuel mix data for several days at once.
+
+        All requests are multiplexed over a single HTTP/2 connection, with at most
+        `max_concurrency` of them in flight so long pulls do not trip rate limits.
+
+        Args:
+            days (List[str]): Days in the format 'YYYYMMDD' for which data is to be retrieved.
+            max_concurrency (int, optional): Maximum number of requests in flight at once.
+                                             Defaults to 8.
+
+        Returns:
+            A list of the responses for each day, in the same order as `days`.
+
+        Raises:
+            ValueError: If any of the days is not in the correct format.
+        """
+        # Validate every date before making any API call
+        for day in days:
+            validate_date_format(day)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def retrieve(day, async_session):
+            async with semaphore:
+                return await self.async_retrieve_data(day, async_session)
+
+        async with self.api_client.async_session() as async_session:
+            return list(await asyncio.gather(*(retrieve(day, async_session) for day in days)))
@@ -1,24 +1,146 @@
 """Parsers for responses from ISO-NE API"""
+from itertools import chain
+
 import pandas as pd
 
+try:
+    import ijson
+except ImportError:  # ijson is an optional dependency for streamed responses
+    ijson = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is an optional, columnar backend for building DataFrames
+    pa = None
+
+
+def _is_flat(record: dict) -> bool:
+    """Check whether a record holds only scalar values, i.e. needs no flattening."""
+    return not any(isinstance(value, (dict, list)) for value in record.values())
+
 
-def parse_json_response(data, record_path: list = None) -> pd.DataFrame:
+def _records_to_frame(records: list) -> pd.DataFrame:
+    """
+    Build a DataFrame from records, transposing flat records into column lists first.
+
+    When pyarrow is installed, its typed columnar builders do the transpose in one pass.
+    Otherwise, handing pandas one list per column avoids its per-record dict handling.
+    Column order follows first appearance, as json_normalize would. Records that hold
+    nested values anywhere are flattened by json_normalize instead.
+    """
+    if not all(isinstance(record, dict) and _is_flat(record) for record in records):
+        return pd.json_normalize(records)
+
+    columns = dict.fromkeys(chain.from_iterable(records))
+    if pa is not None:
+        try:
+            table = pa.Table.from_pylist(records)
+        except (pa.ArrowException, OverflowError):
+            # Values of mixed types in a column, or integers beyond int64, cannot be typed;
+            # build the columns below
+            table = None
+        # Arrow takes its columns from the first record only
+        if table is not None and table.num_columns == len(columns):
+            return table.to_pandas(self_destruct=True)
+    data = {column: [record.get(column) for record in records] for column in columns}
+    return pd.DataFrame(data, copy=False)
+
+
+def _apply_dtype(response_df: pd.DataFrame, dtype: dict = None) -> pd.DataFrame:
+    """Cast the columns named in a dtype schema, ignoring columns the data lacks."""
+    if not dtype:
+        return response_df
+    present = {column: kind for column, kind in dtype.items() if column in response_df}
+    return response_df.astype(present) if present else response_df
+
+
+def _locate_records(data, record_path: list = None, record_accessor=None):
+    """Walk down to the nested records, preferring a precompiled accessor."""
+    if record_accessor is not None:
+        try:
+            nested_data = record_accessor(data)
+        except (KeyError, TypeError):
+            nested_data = None
+        if nested_data:
+            return nested_data
+        if not record_path:
+            raise KeyError("Records not found in the provided data.")
+
+    # Walking key by key reports which key is missing
+    nested_data = data
+    for key in record_path:
+        nested_data = nested_data.get(key, [])
+        if not nested_data:
+            raise KeyError(f"Key '{key}' not found in the provided data.")
+    return nested_data
+
+
+def parse_json_response(
+    data, record_path: list = None, dtype: dict = None, record_accessor=None
+) -> pd.DataFrame:
     """
     Transforms nested JSON into a pandas DataFrame.
 
     :param data: dict, the JSON data returned from the API.
     :param record_path: list, the path (as a list of keys) to the nested data.
+    :param dtype: dict, optional mapping of column names to dtypes to cast to.
+    :param record_accessor: callable, optional precompiled lookup of the nested data,
+        such as a DataRetriever's, used instead of walking `record_path` key by key.
     :return: DataFrame containing the nested data.
     """
-    if record_path:
-        nested_data = data
-        for key in record_path:
-            nested_data = nested_data.get(key, [])
-            if not nested_data:
-                raise KeyError(f"Key '{key}' not found in the provided data.")
+    if record_path or record_accessor is not None:
+        nested_data = _locate_records(data, record_path, record_accessor)
         if isinstance(nested_data, list):
-            return pd.json_normalize(nested_data)
+            # Flat records skip the recursive path-building of json_normalize
+            return _apply_dtype(_records_to_frame(nested_data), dtype)
         else:
             raise TypeError("Nested data is not a list.")
 
-    return pd.DataFrame(data)
+    return _apply_dtype(pd.DataFrame(data), dtype)
+
+
+def parse_json_responses(
+    responses: list, record_path: list = None, dtype: dict = None, record_accessor=None
+) -> pd.DataFrame:
+    """
+    Transforms several nested JSON responses into a single pandas DataFrame.
+
+    Records from all responses are gathered and built into one DataFrame in a single
+    pass, rather than parsing each response and concatenating the results.
+
+    :param responses: list, the JSON data returned from the API, e.g. by `retrieve_many`.
+    :param record_path: list, the path (as a list of keys) to the nested data.
+    :param dtype: dict, optional mapping of column names to dtypes to cast to.
+    :param record_accessor: callable, optional precompiled lookup of the nested data,
+        such as a DataRetriever's, used instead of walking `record_path` key by key.
+    :return: DataFrame containing the nested data of every response.
+    """
+    record_sets = [_locate_records(data, record_path, record_accessor) for data in responses]
+    if not all(isinstance(records, list) for records in record_sets):
+        raise TypeError("Nested data is not a list.")
+    nested_data = list(chain.from_iterable(record_sets))
+    if not nested_data:
+        return _apply_dtype(pd.DataFrame(), dtype)
+    return _apply_dtype(_records_to_frame(nested_data), dtype)
+
+
+def parse_json_response_stream(raw, record_path: list, dtype: dict = None) -> pd.DataFrame:
+    """
+    Transforms a streamed JSON response into a pandas DataFrame without buffering the body.
+
+    Records are parsed incrementally from the stream, so the full payload never needs to
+    be held in memory. Requires the optional `ijson` package.
+
+    :param raw: file-like, the JSON body stream, e.g. from `ISONEClient.get_data(..., stream=True)`.
+    :param record_path: list, the path (as a list of keys) to the nested data.
+    :param dtype: dict, optional mapping of column names to dtypes to cast to.
+    :return: DataFrame containing the nested data.
+    """
+    if ijson is None:
+        raise ImportError("The ijson package is required to parse streamed responses.")
+
+    records = list(ijson.items(raw, ".".join(record_path) + ".item", use_float=True))
+    if not records:
+        raise KeyError(f"Records at '{'.'.join(record_path)}' not found in the provided data.")
+
+    return _apply_dtype(_records_to_frame(records), dtype)
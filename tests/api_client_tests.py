@@ -1,13 +1,25 @@
 """Testing for API client objects"""
+import asyncio
+import tempfile
+import time
 import unittest
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
 
-from api_client import load_environment_secrets
+from api_client import ISONEClient, httpx, load_environment_secrets, zstandard
+
+
+def mock_response(status_code=200, content=b"{}", headers=None):
+    """Build a stand-in for a `requests.Response`"""
+    return Mock(status_code=status_code, content=content, headers=headers or {})
 
 
 class TestLoadEnvironmentSecrets(unittest.TestCase):
     """Testing for `load_environment_secrets` function"""
 
+    def setUp(self):
+        load_environment_secrets.cache_clear()
+
     @patch("os.getenv")
     def test_default_dotenv_path(self, mock_getenv):
         """Test load from default .env path"""
@@ -21,6 +33,182 @@ class TestLoadEnvironmentSecrets(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             load_environment_secrets()
 
+    @patch("os.getenv")
+    def test_cached_credentials(self, mock_getenv):
+        """Assert that repeated loads reuse the cached credentials"""
+        mock_getenv.side_effect = ["user123", "pass123"]
+        self.assertEqual(load_environment_secrets(), ("user123", "pass123"))
+        self.assertEqual(load_environment_secrets(), ("user123", "pass123"))
+        self.assertEqual(mock_getenv.call_count, 2)
+
+
+@patch("api_client.load_environment_secrets", Mock(return_value=("user123", "pass123")))
+class TestISONEClient(unittest.TestCase):
+    """Testing for `ISONEClient` class"""
+
+    def test_retries_exhausted_raise_http_error(self):
+        """Assert that exhausted retries leave the HTTPError to raise_for_status"""
+        with ISONEClient() as client:
+            retries = client.session.get_adapter(client.BASE_URL).max_retries
+        self.assertFalse(retries.raise_on_status)
+        self.assertIn(503, retries.status_forcelist)
+
+    def test_conditional_get(self):
+        """Test a 304 reply returns the cached data of a response with an ETag"""
+        with ISONEClient() as client, patch.object(client.session, "get") as mock_get:
+            mock_get.side_effect = [
+                mock_response(content=b'{"GenFuelMixes": {}}', headers={"ETag": '"abc"'}),
+                mock_response(status_code=304, content=b""),
+            ]
+            first = client.get_data("genfuelmix/day/20231201")
+            second = client.get_data("genfuelmix/day/20231201")
+
+        self.assertEqual(first, {"GenFuelMixes": {}})
+        self.assertEqual(second, first)
+        self.assertEqual(mock_get.call_args.kwargs["headers"], {"If-None-Match": '"abc"'})
+
+    def test_conditional_get_disabled(self):
+        """Test a zero sized ETag cache sends unconditional requests"""
+        with ISONEClient(etag_cache_size=0) as client, patch.object(
+            client.session,
+            "get",
+            return_value=mock_response(content=b'{"a": 1}', headers={"ETag": '"abc"'}),
+        ) as mock_get:
+            client.get_data("genfuelmix/day/20231201")
+            client.get_data("genfuelmix/day/20231201")
+
+        self.assertIsNone(mock_get.call_args.kwargs["headers"])
+
+    def test_xml_utf8(self):
+        """Test an XML body without a declared charset is decoded as UTF-8"""
+        body = "<GenFuelMix><FuelCategory>Hydro – Québec</FuelCategory></GenFuelMix>"
+        with ISONEClient() as client, patch.object(
+            client.session,
+            "get",
+            return_value=mock_response(
+                content=body.encode("utf-8"), headers={"Content-Type": "application/xml"}
+            ),
+        ) as mock_get:
+            self.assertEqual(
+                client.get_data("genfuelmix/day/20231201", file_format="xml"), body
+            )
+
+        self.assertTrue(mock_get.call_args.args[0].endswith("/genfuelmix/day/20231201.xml"))
+        self.assertEqual(mock_get.call_args.kwargs["headers"], {"Accept": "application/xml"})
+
+    def test_stream(self):
+        """Test a streamed request returns the decoding body stream and skips the ETag cache"""
+        with ISONEClient() as client, patch.object(client.session, "get") as mock_get:
+            mock_get.side_effect = lambda *args, **kwargs: mock_response(
+                headers={"ETag": '"abc"'}
+            )
+            first = client.get_data("genfuelmix/day/20231201", stream=True)
+            client.get_data("genfuelmix/day/20231201", stream=True)
+
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        self.assertIsNone(mock_get.call_args.kwargs["headers"])
+        self.assertIs(first.decode_content, True)
+        self.assertEqual(len(client._etag_cache), 0)
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_disk_cache(self):
+        """Test a response cached to disk is served to a new client without a request"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with ISONEClient(cache_dir=cache_dir) as client, patch.object(
+                client.session, "get", return_value=mock_response(content=b'{"a": 1}')
+            ):
+                client.get_data("genfuelmix/day/20231201")
+
+            with ISONEClient(cache_dir=cache_dir) as client, patch.object(
+                client.session, "get"
+            ) as mock_get:
+                self.assertEqual(client.get_data("genfuelmix/day/20231201"), {"a": 1})
+            mock_get.assert_not_called()
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_disk_cache_expired(self):
+        """Test a cached response older than the cache TTL is fetched again"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with ISONEClient(cache_dir=cache_dir, cache_ttl=60) as client, patch.object(
+                client.session, "get", return_value=mock_response(content=b'{"a": 1}')
+            ) as mock_get:
+                client.get_data("genfuelmix/day/20231201")
+                with patch("api_client.time.time", return_value=time.time() + 120):
+                    client.get_data("genfuelmix/day/20231201")
+            self.assertEqual(mock_get.call_count, 2)
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_disk_cache_corrupt(self):
+        """Test an unreadable cache file is fetched again and replaced"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with ISONEClient(cache_dir=cache_dir) as client, patch.object(
+                client.session, "get", return_value=mock_response(content=b'{"a": 1}')
+            ) as mock_get:
+                client.get_data("genfuelmix/day/20231201")
+                (cache_file,) = Path(cache_dir).iterdir()
+                cache_file.write_bytes(b"not zstd")
+                self.assertEqual(client.get_data("genfuelmix/day/20231201"), {"a": 1})
+                self.assertEqual(client.get_data("genfuelmix/day/20231201"), {"a": 1})
+            self.assertEqual(mock_get.call_count, 2)
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_disk_cache_write_failure(self):
+        """Test a failed cache write still returns the data and leaves no temporary file"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with ISONEClient(cache_dir=cache_dir) as client, patch.object(
+                client.session, "get", return_value=mock_response(content=b'{"a": 1}')
+            ), patch("api_client.os.replace", side_effect=OSError("disk full")):
+                self.assertEqual(client.get_data("genfuelmix/day/20231201"), {"a": 1})
+            self.assertEqual(list(Path(cache_dir).iterdir()), [])
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+@patch("api_client.asyncio.sleep", AsyncMock())
+@patch("api_client.load_environment_secrets", Mock(return_value=("user123", "pass123")))
+class TestISONEClientAsync(unittest.TestCase):
+    """Testing for the asynchronous requests of `ISONEClient`"""
+
+    def get_data(self, handler):
+        """Run `async_get_data` against a mock transport answering with `handler`"""
+
+        async def run():
+            client = ISONEClient()
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler), base_url=client.BASE_URL + "/"
+            ) as async_session:
+                return await client.async_get_data(async_session, "genfuelmix/day/20231201")
+
+        return asyncio.run(run())
+
+    def test_async_get_data(self):
+        """Test the endpoint is requested relative to the base URL and parsed"""
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, content=b'{"a": 1}')
+
+        self.assertEqual(self.get_data(handler), {"a": 1})
+        self.assertEqual(
+            requested, [f"{ISONEClient.BASE_URL}/genfuelmix/day/20231201.json"]
+        )
+
+    def test_async_retries(self):
+        """Test rate limited and failed responses are retried"""
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "1"}),
+                httpx.Response(503),
+                httpx.Response(200, content=b'{"a": 1}'),
+            ]
+        )
+        self.assertEqual(self.get_data(lambda request: next(responses)), {"a": 1})
+
+    def test_async_retries_exhausted(self):
+        """Assert that a status still failing after the retries raises an error"""
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.get_data(lambda request: httpx.Response(503))
+
 
 if __name__ == "__main__":
     unittest.main()
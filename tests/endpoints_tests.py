@@ -0,0 +1,120 @@
+"""Testing for endpoint data retrievers"""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+from endpoint_paths import DailyFuelMix, create_endpoint_url
+from endpoints import DailyFuelMixDataRetriever, validate_date_format
+
+
+class TestValidateDateFormat(unittest.TestCase):
+    """Testing for `validate_date_format` function"""
+
+    def test_valid_date(self):
+        """Test that a strict YYYYMMDD date passes"""
+        self.assertIsNone(validate_date_format("20231201"))
+        self.assertIsNone(validate_date_format("20240229"))
+
+    def test_wrong_format(self):
+        """Assert that dates not in the strict format raise an error"""
+        for date_text in ("2023-12-01", "2023121", "202312011", "2023120a", "２０２３１２０１", "09991201"):
+            with self.assertRaises(ValueError):
+                validate_date_format(date_text)
+
+    def test_invalid_calendar_date(self):
+        """Assert that out of range calendar dates raise an error"""
+        for date_text in ("20230230", "20231301", "20231200", "00001201"):
+            with self.assertRaises(ValueError):
+                validate_date_format(date_text)
+
+
+class TestCreateEndpointUrl(unittest.TestCase):
+    """Testing for `create_endpoint_url` function"""
+
+    def test_named_parameters(self):
+        """Test parameters are substituted into the endpoint template by name"""
+        self.assertEqual(
+            create_endpoint_url(DailyFuelMix, {"day": "20231201"}),
+            "genfuelmix/day/20231201",
+        )
+
+    def test_unhashable_parameters(self):
+        """Test parameter values need not be hashable"""
+        self.assertEqual(
+            create_endpoint_url(DailyFuelMix, {"day": ["20231201"]}),
+            "genfuelmix/day/['20231201']",
+        )
+
+
+class TestDailyFuelMixDataRetriever(unittest.TestCase):
+    """Testing for `DailyFuelMixDataRetriever` class"""
+
+    def setUp(self):
+        self.api_client = Mock(POOL_MAXSIZE=32)
+        self.api_client.get_data.side_effect = lambda endpoint, **kwargs: {"endpoint": endpoint}
+
+    def test_record_accessor(self):
+        """Test the record accessor locates the daily fuel mix records"""
+        retriever = DailyFuelMixDataRetriever(self.api_client)
+        response = {"GenFuelMixes": {"GenFuelMix": [{"GenMw": 1.5}]}}
+        self.assertEqual(retriever.record_accessor(response), [{"GenMw": 1.5}])
+        with self.assertRaises(AttributeError):
+            retriever.record_accessor = None
+
+    def test_retrieve_many(self):
+        """Test several days are retrieved with responses in request order"""
+        retriever = DailyFuelMixDataRetriever(self.api_client)
+        self.assertEqual(
+            retriever.retrieve_many(["20231201", "20231202", "20231203"]),
+            [{"endpoint": f"genfuelmix/day/2023120{day}"} for day in (1, 2, 3)],
+        )
+
+    def test_retrieve_many_validates_first(self):
+        """Assert that a malformed day fails before any request is sent"""
+        retriever = DailyFuelMixDataRetriever(self.api_client)
+        with self.assertRaises(ValueError):
+            retriever.retrieve_many(["20231201", "2023-12-02"])
+        self.api_client.get_data.assert_not_called()
+
+    def test_async_retrieve_many(self):
+        """Test several days are retrieved asynchronously over one shared session"""
+        async_session = Mock()
+        self.api_client.async_session.return_value = MagicMock()
+        self.api_client.async_session.return_value.__aenter__.return_value = async_session
+        self.api_client.async_get_data = AsyncMock(
+            side_effect=lambda session, endpoint: {"endpoint": endpoint}
+        )
+        retriever = DailyFuelMixDataRetriever(self.api_client)
+
+        responses = asyncio.run(retriever.async_retrieve_many(["20231201", "20231202"]))
+
+        self.assertEqual(
+            responses, [{"endpoint": f"genfuelmix/day/2023120{day}"} for day in (1, 2)]
+        )
+        for call in self.api_client.async_get_data.call_args_list:
+            self.assertIs(call.args[0], async_session)
+
+    def test_async_retrieve_many_bounds_concurrency(self):
+        """Test no more than `max_concurrency` requests are in flight at once"""
+        in_flight = []
+        peak = []
+
+        async def get_data(session, endpoint):
+            in_flight.append(endpoint)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(endpoint)
+            return endpoint
+
+        self.api_client.async_session.return_value = MagicMock()
+        self.api_client.async_get_data = get_data
+        retriever = DailyFuelMixDataRetriever(self.api_client)
+        days = [f"202312{day:02d}" for day in range(1, 11)]
+
+        asyncio.run(retriever.async_retrieve_many(days, max_concurrency=3))
+
+        self.assertEqual(max(peak), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Testing for JSON response parsers"""
+import io
+import json
+import unittest
+
+import pandas as pd
+
+from json_parser import (
+    ijson,
+    parse_json_response,
+    parse_json_response_stream,
+    parse_json_responses,
+)
+
+RECORD_PATH = ["GenFuelMixes", "GenFuelMix"]
+
+
+def fuel_mix_response(records):
+    """Wrap records the way the daily fuel mix endpoint does"""
+    return {"GenFuelMixes": {"GenFuelMix": records}}
+
+
+class TestParseJsonResponse(unittest.TestCase):
+    """Testing for `parse_json_response` function"""
+
+    def test_flat_records(self):
+        """Test flat records match a json_normalize of the same records"""
+        records = [
+            {"BeginDate": "2023-12-01T00:00:00", "GenMw": 1.5, "FuelCategory": "Oil"},
+            {"BeginDate": "2023-12-01T00:05:00", "GenMw": 2, "FuelCategory": "Wind", "MarginalFlag": "N"},
+        ]
+        pd.testing.assert_frame_equal(
+            parse_json_response(fuel_mix_response(records), RECORD_PATH),
+            pd.json_normalize(records),
+        )
+
+    def test_uniform_flat_records(self):
+        """Test flat records sharing their keys match a json_normalize of the same records"""
+        records = [
+            {"BeginDate": "2023-12-01T00:00:00", "GenMw": 1, "FuelCategory": "Oil"},
+            {"BeginDate": "2023-12-01T00:05:00", "GenMw": 2.5, "FuelCategory": "Wind"},
+        ]
+        pd.testing.assert_frame_equal(
+            parse_json_response(fuel_mix_response(records), RECORD_PATH),
+            pd.json_normalize(records),
+        )
+
+    def test_nested_records(self):
+        """Test nested records are flattened"""
+        records = [{"GenMw": 1.5, "Fuel": {"Category": "Oil"}}]
+        response_df = parse_json_response(fuel_mix_response(records), RECORD_PATH)
+        self.assertEqual(list(response_df.columns), ["GenMw", "Fuel.Category"])
+
+    def test_integers_beyond_int64(self):
+        """Test integers too large for a typed column match a json_normalize of the records"""
+        records = [{"GenMw": 2**70, "FuelCategory": "Oil"}]
+        pd.testing.assert_frame_equal(
+            parse_json_response(fuel_mix_response(records), RECORD_PATH),
+            pd.json_normalize(records),
+        )
+
+    def test_later_nested_record(self):
+        """Test a nested record after flat ones is still flattened"""
+        records = [
+            {"GenMw": 1.5, "Fuel": "Oil"},
+            {"GenMw": 2.5, "Fuel": {"Category": "Wind"}},
+        ]
+        pd.testing.assert_frame_equal(
+            parse_json_response(fuel_mix_response(records), RECORD_PATH),
+            pd.json_normalize(records),
+        )
+
+    def test_dtype_schema(self):
+        """Test declared dtypes are applied and absent columns are ignored"""
+        records = [{"GenMw": 1.5, "FuelCategory": "Oil"}]
+        response_df = parse_json_response(
+            fuel_mix_response(records),
+            RECORD_PATH,
+            dtype={"GenMw": "float32", "FuelCategory": "category", "MarginalFlag": "category"},
+        )
+        self.assertEqual(response_df["GenMw"].dtype, "float32")
+        self.assertIsInstance(response_df["FuelCategory"].dtype, pd.CategoricalDtype)
+
+    def test_record_accessor(self):
+        """Test a precompiled accessor locates the records without a record path"""
+        records = [{"GenMw": 1.5, "FuelCategory": "Oil"}]
+        response_df = parse_json_response(
+            fuel_mix_response(records),
+            record_accessor=lambda data: data["GenFuelMixes"]["GenFuelMix"],
+        )
+        self.assertEqual(response_df["GenMw"].tolist(), [1.5])
+
+    def test_missing_key(self):
+        """Assert that a missing record path key raises an error"""
+        with self.assertRaises(KeyError):
+            parse_json_response({"GenFuelMixes": {}}, RECORD_PATH)
+        with self.assertRaisesRegex(KeyError, "GenFuelMix"):
+            parse_json_response(
+                {"GenFuelMixes": {}},
+                RECORD_PATH,
+                record_accessor=lambda data: data["GenFuelMixes"]["GenFuelMix"],
+            )
+
+
+class TestParseJsonResponses(unittest.TestCase):
+    """Testing for `parse_json_responses` function"""
+
+    def test_combined_responses(self):
+        """Test records of several responses are combined into one DataFrame"""
+        responses = [
+            fuel_mix_response([{"GenMw": 1.5, "FuelCategory": "Oil"}]),
+            fuel_mix_response([{"GenMw": 2.5, "FuelCategory": "Wind"}]),
+        ]
+        dtype = {"GenMw": "float32", "FuelCategory": "category"}
+        response_df = parse_json_responses(responses, RECORD_PATH, dtype=dtype)
+        self.assertEqual(response_df["GenMw"].tolist(), [1.5, 2.5])
+        self.assertEqual(list(response_df["FuelCategory"].cat.categories), ["Oil", "Wind"])
+
+    def test_records_not_a_list(self):
+        """Assert that a record path leading to a single record raises an error"""
+        responses = [
+            fuel_mix_response([{"GenMw": 1.5}]),
+            fuel_mix_response({"GenMw": 2.5}),
+        ]
+        with self.assertRaisesRegex(TypeError, "not a list"):
+            parse_json_responses(responses, RECORD_PATH)
+
+
+@unittest.skipIf(ijson is None, "ijson is not installed")
+class TestParseJsonResponseStream(unittest.TestCase):
+    """Testing for `parse_json_response_stream` function"""
+
+    def test_streamed_records(self):
+        """Test streamed records match the buffered parse of the same response"""
+        records = [
+            {"BeginDate": "2023-12-01T00:00:00", "GenMw": 1.5, "FuelCategory": "Oil"},
+            {"BeginDate": "2023-12-01T00:05:00", "GenMw": 2.5, "FuelCategory": "Wind"},
+        ]
+        body = io.BytesIO(json.dumps(fuel_mix_response(records)).encode())
+        pd.testing.assert_frame_equal(
+            parse_json_response_stream(body, RECORD_PATH),
+            parse_json_response(fuel_mix_response(records), RECORD_PATH),
+        )
+
+    def test_missing_records(self):
+        """Assert that a stream without records raises an error"""
+        with self.assertRaises(KeyError):
+            parse_json_response_stream(io.BytesIO(b'{"GenFuelMixes": {}}'), RECORD_PATH)
+
+
+if __name__ == "__main__":
+    unittest.main()